@@ -10,11 +10,11 @@ Autor: Tutorial Python
 Versão: 2.0 - Otimizada
 """
 
-from collections import deque
+from collections import deque, OrderedDict
 import queue
 import heapq
 import time
-from typing import List, Any, Optional
+from typing import Iterable, Iterator, List, Any, Optional
 
 
 class FilaOtimizada:
@@ -27,6 +27,10 @@ class FilaOtimizada:
         """Insere elemento no final da fila."""
         self._fila.append(elemento)
     
+    def estender(self, elementos: Iterable[Any]) -> None:
+        """Insere vários elementos no final da fila, em ordem."""
+        self._fila.extend(elementos)
+    
     def remover(self) -> Optional[Any]:
         """Remove e retorna o primeiro elemento da fila."""
         if self._fila:
@@ -66,6 +70,98 @@ class FilaOtimizada:
     def __str__(self) -> str:
         return f"Fila({list(self._fila)})"
     
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._fila)
+    
+    def __len__(self) -> int:
+        return len(self._fila)
+
+
+class FilaSemDuplicatas:
+    """
+    Fila FIFO sem elementos repetidos, com busca e remoção em O(1).
+
+    Usa um OrderedDict (hash + lista duplamente encadeada) no lugar do
+    deque: `contem()` e `remover_item()` não precisam percorrer a fila.
+    Os elementos precisam ser hashable.
+
+    Política para inserção de um elemento que já está na fila:
+      - "ignorar":   mantém a posição original (submissão idempotente)
+      - "mover_fim": move o elemento para o final da fila
+    """
+
+    POLITICAS = ("ignorar", "mover_fim")
+
+    def __init__(self, politica: str = "ignorar"):
+        if politica not in self.POLITICAS:
+            raise ValueError(f"Política inválida: '{politica}'. Use {self.POLITICAS}")
+        self.politica = politica
+        self._fila = OrderedDict()
+
+    def inserir(self, elemento: Any) -> bool:
+        """Insere no final. Retorna False se o elemento já estava na fila."""
+        if elemento in self._fila:
+            if self.politica == "mover_fim":
+                self._fila.move_to_end(elemento)
+            return False
+        self._fila[elemento] = None
+        return True
+
+    def remover(self) -> Optional[Any]:
+        """Remove e retorna o primeiro elemento da fila."""
+        if self._fila:
+            return self._fila.popitem(last=False)[0]
+        return None
+
+    def remover_item(self, elemento: Any) -> bool:
+        """Remove um elemento de qualquer posição. Retorna True se existia."""
+        if elemento in self._fila:
+            del self._fila[elemento]
+            return True
+        return False
+
+    def contem(self, elemento: Any) -> bool:
+        """Verifica se o elemento está na fila em O(1)."""
+        return elemento in self._fila
+
+    def primeiro(self) -> Optional[Any]:
+        """Retorna o primeiro elemento sem remover."""
+        return next(iter(self._fila), None)
+
+    def ultimo(self) -> Optional[Any]:
+        """Retorna o último elemento sem remover."""
+        return next(reversed(self._fila), None)
+
+    def vazia(self) -> bool:
+        """Verifica se a fila está vazia."""
+        return len(self._fila) == 0
+
+    def tamanho(self) -> int:
+        """Retorna o tamanho da fila."""
+        return len(self._fila)
+
+    def limpar(self) -> None:
+        """Remove todos os elementos da fila."""
+        self._fila.clear()
+
+    def listar(self) -> List[Any]:
+        """Retorna uma lista com todos os elementos."""
+        return list(self._fila)
+
+    def ordenar(self) -> None:
+        """Ordena a fila (quebra temporariamente o princípio FIFO)."""
+        elementos = sorted(self._fila)
+        self._fila = OrderedDict.fromkeys(elementos)
+
+    def __contains__(self, elemento: Any) -> bool:
+        return elemento in self._fila
+
+    def __str__(self) -> str:
+        return f"FilaSemDuplicatas({list(self._fila)})"
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._fila)
+
     def __len__(self) -> int:
         return len(self._fila)
 
@@ -200,6 +296,97 @@ def benchmark_performance():
     print(f"   deque é {tempo_lista/tempo_deque:.1f}x mais rápida!")
 
 
+def demonstracao_fila_sem_duplicatas():
+    """Demonstração da FilaSemDuplicatas (submissão idempotente de jobs)."""
+    print("\n" + "=" * 60)
+    print("DEMONSTRAÇÃO - FILA SEM DUPLICATAS")
+    print("=" * 60)
+
+    fila = FilaSemDuplicatas()
+
+    print("\n1. Inserindo jobs (política 'ignorar'):")
+    for job in ["job-1", "job-2", "job-1", "job-3", "job-2"]:
+        inserido = fila.inserir(job)
+        status = "inserido" if inserido else "ignorado (já na fila)"
+        print(f"   {job}: {status} | Fila: {fila.listar()}")
+
+    print("\n2. Busca e remoção no meio da fila:")
+    print(f"   contem('job-2'): {fila.contem('job-2')}")
+    fila.remover_item("job-2")
+    print(f"   Após remover_item('job-2'): {fila.listar()}")
+
+    print("\n3. Política 'mover_fim':")
+    fila = FilaSemDuplicatas(politica="mover_fim")
+    for job in ["job-1", "job-2", "job-3", "job-1"]:
+        fila.inserir(job)
+    print(f"   Inserindo job-1, job-2, job-3, job-1: {fila.listar()}")
+
+    benchmark_fila_sem_duplicatas()
+
+
+def benchmark_fila_sem_duplicatas():
+    """Benchmark de busca e remoção: FilaSemDuplicatas vs varredura do deque."""
+    print("\n" + "=" * 60)
+    print("BENCHMARK - BUSCA E REMOÇÃO NO MEIO DA FILA")
+    print("=" * 60)
+
+    n = 20000
+    consultas = 2000
+    alvos = [(i * 7919) % n for i in range(consultas)]
+
+    fila_deque = deque(range(n))
+    fila_hash = FilaSemDuplicatas()
+    for i in range(n):
+        fila_hash.inserir(i)
+
+    # Busca (contem)
+    start_time = time.time()
+    for alvo in alvos:
+        alvo in fila_deque  # Varredura - O(n)
+    tempo_busca_deque = time.time() - start_time
+
+    start_time = time.time()
+    for alvo in alvos:
+        fila_hash.contem(alvo)  # Hash - O(1)
+    tempo_busca_hash = time.time() - start_time
+
+    # Remoção de itens no meio da fila
+    start_time = time.time()
+    for alvo in alvos:
+        try:
+            fila_deque.remove(alvo)  # Varredura + deslocamento - O(n)
+        except ValueError:
+            pass
+    tempo_remocao_deque = time.time() - start_time
+
+    start_time = time.time()
+    for alvo in alvos:
+        fila_hash.remover_item(alvo)  # O(1)
+    tempo_remocao_hash = time.time() - start_time
+
+    # Inserção com deduplicação (verifica antes de inserir)
+    start_time = time.time()
+    for alvo in alvos:
+        if alvo not in fila_deque:
+            fila_deque.append(alvo)
+    tempo_dedup_deque = time.time() - start_time
+
+    start_time = time.time()
+    for alvo in alvos:
+        fila_hash.inserir(alvo)
+    tempo_dedup_hash = time.time() - start_time
+
+    print(f"\nResultados para fila com {n:,} itens e {consultas:,} operações:")
+    print(f"   {'Operação':<22}{'deque':>10}{'sem dup.':>12}")
+    for nome, t_deque, t_hash in [
+        ("contem", tempo_busca_deque, tempo_busca_hash),
+        ("remover_item", tempo_remocao_deque, tempo_remocao_hash),
+        ("inserir com dedup", tempo_dedup_deque, tempo_dedup_hash),
+    ]:
+        ganho = t_deque / t_hash if t_hash > 0 else float("inf")
+        print(f"   {nome:<22}{t_deque:>9.4f}s{t_hash:>11.4f}s  ({ganho:.0f}x)")
+
+
 def menu_interativo():
     """Menu interativo para testar operações de fila."""
     print("\n" + "=" * 60)
@@ -349,10 +536,11 @@ def main():
         print("4. Demonstração classe otimizada")
         print("5. Benchmark de performance")
         print("6. Menu interativo")
+        print("7. Demonstração fila sem duplicatas")
         print("0. Sair")
         
         try:
-            opcao = input("\nEscolha uma opção (0-6): ").strip()
+            opcao = input("\nEscolha uma opção (0-7): ").strip()
             
             if opcao == "0":
                 print("\n👋 Obrigado por usar o tutorial! Até mais!")
@@ -369,8 +557,10 @@ def main():
                 benchmark_performance()
             elif opcao == "6":
                 menu_interativo()
+            elif opcao == "7":
+                demonstracao_fila_sem_duplicatas()
             else:
-                print("❌ Opção inválida! Escolha um número de 0 a 6.")
+                print("❌ Opção inválida! Escolha um número de 0 a 7.")
                 
             if opcao != "0":
                 input("\n⏸️  Pressione ENTER para continuar...")
@@ -0,0 +1,231 @@
+"""
+MESCLAGEM DE DICIONÁRIOS - K-way merge preguiçoso e atualização em lote
+=======================================================================
+
+Combinar dezenas de dicionários grandes (ex.: `notas` ou tabelas de
+`produtos` divididas em shards) com `update()` repetido seguido de
+`dict(sorted(...))` materializa tudo de uma vez: o dicionário combinado
+e ainda a lista ordenada de itens.
+
+Este módulo oferece:
+  - mesclar_ordenados():  merge preguiçoso de K fontes já ordenadas por
+                          chave usando heapq.merge (memória O(K))
+  - mesclar_dicionarios(): atalho que devolve um dict ordenado
+  - update_lote():        atualização em lote, in-place, sem cópias
+                          intermediárias
+
+Conflitos (mesma chave em várias fontes) são resolvidos por uma função
+binária `resolver(valor_acumulado, valor_novo)`, aplicada na ordem das
+fontes: `ultimo_vence`, `primeiro_vence`, `somar` ou qualquer função.
+"""
+
+import heapq
+import operator
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+Resolver = Callable[[Any, Any], Any]
+
+
+def ultimo_vence(atual: Any, novo: Any) -> Any:
+    """Mantém o valor da última fonte (mesmo comportamento de update())."""
+    return novo
+
+
+def primeiro_vence(atual: Any, novo: Any) -> Any:
+    """Mantém o valor da primeira fonte (mesmo comportamento de setdefault())."""
+    return atual
+
+
+somar = operator.add
+
+
+def _itens(fonte: Any) -> Iterable[Tuple[Any, Any]]:
+    """Aceita mapeamento, objeto com atributo `dados` ou iterável de pares."""
+    fonte = getattr(fonte, "dados", fonte)
+    # Mesmo critério de dict.update(): quem tem keys() é tratado como mapeamento
+    if hasattr(fonte, "keys"):
+        return fonte.items()
+    return fonte
+
+
+def mesclar_ordenados(*fontes: Any,
+                      resolver: Resolver = ultimo_vence) -> Iterator[Tuple[Any, Any]]:
+    """
+    Mescla fontes ordenadas por chave, gerando pares (chave, valor) em ordem.
+
+    Cada fonte deve estar ordenada por chave (um dict criado com
+    `dict(sorted(...))`, por exemplo). Apenas um item por fonte fica em
+    memória. Chaves iguais são combinadas com `resolver`, respeitando a
+    ordem das fontes (heapq.merge é estável).
+
+    Levanta ValueError se alguma fonte não estiver ordenada: uma fonte fora
+    de ordem sempre faz a sequência mesclada voltar para trás.
+    """
+    fluxo = heapq.merge(*(_itens(f) for f in fontes), key=operator.itemgetter(0))
+    vazio = object()
+    chave_atual = valor = vazio
+    for chave, novo in fluxo:
+        if chave == chave_atual:
+            valor = resolver(valor, novo)
+        else:
+            if chave_atual is not vazio:
+                if chave < chave_atual:
+                    raise ValueError(
+                        f"Fonte fora de ordem: chave {chave!r} depois de {chave_atual!r}. "
+                        "Use mesclar_dicionarios(..., ordenados=False)"
+                    )
+                yield chave_atual, valor
+            chave_atual, valor = chave, novo
+    if chave_atual is not vazio:
+        yield chave_atual, valor
+
+
+def mesclar_dicionarios(*fontes: Any,
+                        resolver: Resolver = ultimo_vence,
+                        ordenados: bool = True) -> Dict[Any, Any]:
+    """
+    Mescla dicionários em um novo dict ordenado por chave.
+
+    Com `ordenados=False` cada fonte é ordenada individualmente antes do
+    merge (custo O(n log n) por fonte, sem juntar tudo numa lista só).
+    Com `ordenados=True`, fontes fora de ordem levantam ValueError.
+    """
+    if not ordenados:
+        fontes = tuple(sorted(_itens(f), key=operator.itemgetter(0)) for f in fontes)
+    return dict(mesclar_ordenados(*fontes, resolver=resolver))
+
+
+def update_lote(destino: Dict[Any, Any], *fontes: Any,
+                resolver: Optional[Resolver] = None) -> Dict[Any, Any]:
+    """
+    Atualiza `destino` in-place com várias fontes, sem cópias intermediárias.
+
+    Sem `resolver` (último vence), cada fonte (mapeamento, objeto com
+    `dados` ou iterável de pares) vai direto para `dict.update()`. Para dicts, o
+    caminho em C redimensiona a tabela uma única vez para o tamanho final,
+    em vez de crescer item a item. Com `resolver`, chaves existentes são
+    combinadas com o valor atual (um laço em Python, então mais lento que
+    `update()` puro). Retorna o próprio `destino`.
+    """
+    destino = getattr(destino, "dados", destino)
+    if resolver is None:
+        for fonte in fontes:
+            # Passa o próprio mapeamento (não .items()) para usar o caminho
+            # pré-dimensionado de dict.update()
+            destino.update(getattr(fonte, "dados", fonte))
+        return destino
+
+    ausente = object()
+    obter = destino.get
+    for fonte in fontes:
+        for chave, valor in _itens(fonte):
+            atual = obter(chave, ausente)
+            destino[chave] = valor if atual is ausente else resolver(atual, valor)
+    return destino
+
+
+def _medir(funcao: Callable[[], Any]) -> Tuple[float, int, Any]:
+    """Executa `funcao` e retorna (tempo, pico de memória em bytes, resultado)."""
+    tracemalloc.start()
+    inicio = time.perf_counter()
+    resultado = funcao()
+    tempo = time.perf_counter() - inicio
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return tempo, pico, resultado
+
+
+def benchmark_mesclagem(n_shards: int = 24, itens_por_shard: int = 20000):
+    """Compara update() + dict(sorted(...)) com o merge preguiçoso."""
+    print("=" * 60)
+    print("BENCHMARK - MESCLAGEM DE DICIONÁRIOS ORDENADOS")
+    print("=" * 60)
+
+    # Shards com chaves sobrepostas, cada um ordenado por chave
+    shards = [
+        {f"aluno{(s * 7 + i * 3) % (n_shards * itens_por_shard // 2):07d}": float(i % 10)
+         for i in range(itens_por_shard)}
+        for s in range(n_shards)
+    ]
+    shards = [dict(sorted(d.items())) for d in shards]
+
+    def atual_ultimo_vence():
+        combinado = {}
+        for d in shards:
+            combinado.update(d)
+        return dict(sorted(combinado.items()))
+
+    def atual_somar():
+        combinado = {}
+        for d in shards:
+            for k, v in d.items():
+                combinado[k] = combinado.get(k, 0) + v
+        return dict(sorted(combinado.items()))
+
+    def merge_ultimo_vence():
+        return mesclar_dicionarios(*shards)
+
+    def merge_somar():
+        return mesclar_dicionarios(*shards, resolver=somar)
+
+    def streaming_somar():
+        # Consome o merge sem materializar o resultado (ex.: gravar em disco)
+        total = 0.0
+        for _, valor in mesclar_ordenados(*shards, resolver=somar):
+            total += valor
+        return total
+
+    casos = [
+        ("update + sorted (último vence)", atual_ultimo_vence),
+        ("merge preguiçoso (último vence)", merge_ultimo_vence),
+        ("loop get + sorted (soma)", atual_somar),
+        ("merge preguiçoso (soma)", merge_somar),
+        ("merge streaming (soma, sem dict)", streaming_somar),
+    ]
+
+    print(f"\n{n_shards} shards x {itens_por_shard:,} itens:")
+    print(f"   {'Abordagem':<36}{'Tempo':>10}{'Pico mem.':>14}")
+    resultados = {}
+    for nome, funcao in casos:
+        tempo, pico, resultado = _medir(funcao)
+        resultados[nome] = resultado
+        print(f"   {nome:<36}{tempo:>9.4f}s{pico / 1024 / 1024:>11.2f} MB")
+
+    assert resultados[casos[0][0]] == resultados[casos[1][0]]
+    assert resultados[casos[2][0]] == resultados[casos[3][0]]
+
+    def update_repetido():
+        combinado = {}
+        for d in shards:
+            combinado.update(d)
+        return combinado
+
+    def update_repetido_somar():
+        combinado = {}
+        for d in shards:
+            for k, v in d.items():
+                combinado[k] = combinado.get(k, 0) + v
+        return combinado
+
+    casos_lote = [
+        ("update() repetido (último vence)", update_repetido),
+        ("update_lote() (último vence)", lambda: update_lote({}, *shards)),
+        ("loop get (soma)", update_repetido_somar),
+        ("update_lote() (soma)", lambda: update_lote({}, *shards, resolver=somar)),
+    ]
+
+    print("\nAtualização em lote:")
+    resultados = []
+    for nome, funcao in casos_lote:
+        tempo, pico, resultado = _medir(funcao)
+        resultados.append(resultado)
+        print(f"   {nome:<36}{tempo:>9.4f}s{pico / 1024 / 1024:>11.2f} MB")
+
+    assert resultados[0] == resultados[1]
+    assert resultados[2] == resultados[3]
+
+
+if __name__ == "__main__":
+    benchmark_mesclagem()
@@ -0,0 +1,491 @@
+"""
+REPLAY DE OPERAÇÕES - Driver não interativo para filas e dicionários
+====================================================================
+
+Executa, na velocidade máxima, um trace de operações (inserir, remover,
+primeiro, ordenar, limpar) contra qualquer fila ou dicionário do projeto,
+medindo operações por segundo e latência de cada operação.
+
+O trace pode vir de um arquivo texto (uma operação por linha) ou de um
+gerador de cargas sintéticas (chegadas Poisson, rajadas e chaves Zipf).
+
+Formato do arquivo de trace (argumentos em JSON, separados por espaço):
+
+    # comentários e linhas vazias são ignorados
+    inserir "Cliente 1"        (fila: valor)
+    inserir "banana" 3.5       (dicionário: chave valor)
+    remover                    (fila)
+    remover "banana"           (dicionário)
+    primeiro [chave]
+    ordenar
+    limpar
+
+Strings entre aspas preservam espaços e o tipo ("007" continua string).
+Tokens sem aspas que não são JSON válido (ex.: Cliente-1) são lidos
+como string, para facilitar traces escritos à mão.
+
+Uso:
+    python replay_operacoes.py                 # carga sintética
+    python replay_operacoes.py trace.txt       # replay de arquivo
+"""
+
+from collections import deque
+import bisect
+import json
+import math
+import random
+import sys
+import time
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional
+
+from filas_python import FilaOtimizada, FilaSemDuplicatas
+
+
+OPERACOES = ("inserir", "remover", "primeiro", "ordenar", "limpar")
+
+
+class Operacao(NamedTuple):
+    """
+    Uma operação do trace. `chave` só é usada por dicionários.
+
+    `chave=None` significa operação de fila: `inserir` sem chave é gravado e
+    lido com um único argumento, por isso None não é uma chave válida de
+    dicionário em traces.
+    """
+
+    tipo: str
+    chave: Any = None
+    valor: Any = None
+
+
+# ---------------------------------------------------------------------------
+# Leitura de traces
+# ---------------------------------------------------------------------------
+
+_DECODIFICADOR = json.JSONDecoder()
+
+
+def _tokens(texto: str, numero: int) -> Iterator[Any]:
+    """
+    Separa os argumentos de uma linha.
+
+    Strings, listas e objetos JSON (que podem conter espaços) são lidos
+    inteiros com raw_decode; o resto é separado por espaço. Tokens que não
+    são JSON válido viram strings.
+    """
+    pos, fim = 0, len(texto)
+    while True:
+        while pos < fim and texto[pos].isspace():
+            pos += 1
+        if pos >= fim:
+            return
+        if texto[pos] in '"[{':
+            try:
+                valor, pos = _DECODIFICADOR.raw_decode(texto, pos)
+            except json.JSONDecodeError:
+                pass
+            else:
+                yield valor
+                continue
+        inicio = pos
+        while pos < fim and not texto[pos].isspace():
+            pos += 1
+        token = texto[inicio:pos]
+        try:
+            yield json.loads(token)
+        except json.JSONDecodeError:
+            yield token
+
+
+def _formatar_token(valor: Any) -> str:
+    return json.dumps(valor, ensure_ascii=False, separators=(",", ":"))
+
+
+def ler_trace(linhas: Iterable[str]) -> Iterator[Operacao]:
+    """Gera operações a partir de linhas de texto, sem carregar tudo na memória."""
+    for numero, linha in enumerate(linhas, 1):
+        linha = linha.strip()
+        if not linha or linha.startswith("#"):
+            continue
+
+        partes = linha.split(None, 1)
+        tipo = partes[0].lower()
+        if tipo not in OPERACOES:
+            raise ValueError(f"Linha {numero}: operação inválida '{partes[0]}'")
+
+        args = list(_tokens(partes[1], numero)) if len(partes) > 1 else []
+        if tipo == "inserir":
+            if len(args) == 1:
+                yield Operacao(tipo, valor=args[0])
+            elif len(args) == 2:
+                yield Operacao(tipo, chave=args[0], valor=args[1])
+            else:
+                raise ValueError(f"Linha {numero}: 'inserir' espera 1 ou 2 argumentos")
+        elif tipo in ("remover", "primeiro"):
+            if len(args) > 1:
+                raise ValueError(f"Linha {numero}: '{tipo}' espera 0 ou 1 argumento")
+            yield Operacao(tipo, chave=args[0] if args else None)
+        else:
+            if args:
+                raise ValueError(f"Linha {numero}: '{tipo}' não espera argumentos")
+            yield Operacao(tipo)
+
+
+def ler_trace_arquivo(caminho: str) -> Iterator[Operacao]:
+    """Lê um trace de arquivo de forma incremental."""
+    with open(caminho, encoding="utf-8") as arquivo:
+        yield from ler_trace(arquivo)
+
+
+def escrever_trace(operacoes: Iterable[Operacao], caminho: str) -> int:
+    """
+    Grava operações no formato de trace. Retorna quantas foram gravadas.
+
+    Chaves e valores são gravados como JSON compacto e `ler_trace` devolve
+    as mesmas operações, com as conversões do próprio JSON: tuplas voltam
+    como listas e chaves não-string de dicts voltam como strings. Tipos sem
+    equivalente JSON levantam TypeError.
+    """
+    total = 0
+    with open(caminho, "w", encoding="utf-8") as arquivo:
+        for op in operacoes:
+            partes = [op.tipo]
+            if op.chave is not None:
+                partes.append(_formatar_token(op.chave))
+            if op.tipo == "inserir":
+                partes.append(_formatar_token(op.valor))
+            arquivo.write(" ".join(partes) + "\n")
+            total += 1
+    return total
+
+
+# ---------------------------------------------------------------------------
+# Gerador de cargas sintéticas
+# ---------------------------------------------------------------------------
+
+def _poisson(rng: random.Random, media: float) -> int:
+    """Amostra de uma distribuição de Poisson (algoritmo de Knuth)."""
+    if media <= 0:
+        return 0
+    if media > 30:
+        # Aproximação normal para médias grandes (evita underflow de exp)
+        return max(0, round(rng.gauss(media, math.sqrt(media))))
+    limite = math.exp(-media)
+    k, p = 0, 1.0
+    while True:
+        p *= rng.random()
+        if p <= limite:
+            return k
+        k += 1
+
+
+class _AmostradorZipf:
+    """Sorteia índices 0..n-1 com probabilidade proporcional a 1/(i+1)^s."""
+
+    def __init__(self, n: int, s: float, rng: random.Random):
+        self._rng = rng
+        acumulado = 0.0
+        self._pesos_acumulados = []
+        for i in range(1, n + 1):
+            acumulado += 1.0 / (i ** s)
+            self._pesos_acumulados.append(acumulado)
+
+    def sortear(self) -> int:
+        alvo = self._rng.random() * self._pesos_acumulados[-1]
+        return bisect.bisect_left(self._pesos_acumulados, alvo)
+
+
+def gerar_carga(n_operacoes: int = 100000,
+                taxa_chegada: float = 5.0,
+                taxa_atendimento: float = 5.0,
+                prob_rajada: float = 0.01,
+                fator_rajada: float = 20.0,
+                n_chaves: int = 1000,
+                zipf_s: float = 1.1,
+                prob_primeiro: float = 0.1,
+                prob_ordenar: float = 0.0,
+                prob_limpar: float = 0.0,
+                com_chaves: bool = False,
+                semente: Optional[int] = None) -> Iterator[Operacao]:
+    """
+    Gera um trace sintético de forma preguiçosa.
+
+    A cada passo de tempo chegam Poisson(taxa_chegada) inserções e saem
+    Poisson(taxa_atendimento) remoções. Com probabilidade `prob_rajada`
+    o passo é uma rajada, com a taxa de chegada multiplicada por
+    `fator_rajada`. Com `com_chaves=True` as operações recebem chaves
+    sorteadas por uma distribuição Zipf (poucas chaves muito quentes),
+    adequadas para dicionários.
+    """
+    rng = random.Random(semente)
+    zipf = _AmostradorZipf(n_chaves, zipf_s, rng) if com_chaves else None
+    gerados = 0
+    sequencia = 0
+
+    def chave() -> Any:
+        return f"k{zipf.sortear()}" if zipf else None
+
+    while gerados < n_operacoes:
+        media_chegada = taxa_chegada
+        if rng.random() < prob_rajada:
+            media_chegada *= fator_rajada
+
+        passo = []
+        for _ in range(_poisson(rng, media_chegada)):
+            sequencia += 1
+            passo.append(Operacao("inserir", chave(), sequencia))
+        for _ in range(_poisson(rng, taxa_atendimento)):
+            passo.append(Operacao("remover", chave()))
+        if rng.random() < prob_primeiro:
+            passo.append(Operacao("primeiro", chave()))
+        if rng.random() < prob_ordenar:
+            passo.append(Operacao("ordenar"))
+        if rng.random() < prob_limpar:
+            passo.append(Operacao("limpar"))
+
+        for op in passo:
+            if gerados >= n_operacoes:
+                return
+            yield op
+            gerados += 1
+
+
+# ---------------------------------------------------------------------------
+# Adaptadores: traduzem operações do trace para cada implementação
+# ---------------------------------------------------------------------------
+
+class AdaptadorFila:
+    """Adapta objetos com a interface de FilaOtimizada (ou FilaSemDuplicatas)."""
+
+    def __init__(self, fila: Any = None):
+        self.alvo = FilaOtimizada() if fila is None else fila
+
+    def inserir(self, chave: Any, valor: Any) -> None:
+        self.alvo.inserir(valor)
+
+    def remover(self, chave: Any) -> Optional[Any]:
+        return self.alvo.remover()
+
+    def primeiro(self, chave: Any) -> Optional[Any]:
+        return self.alvo.primeiro()
+
+    def ordenar(self) -> None:
+        self.alvo.ordenar()
+
+    def limpar(self) -> None:
+        self.alvo.limpar()
+
+    def __len__(self) -> int:
+        return len(self.alvo)
+
+
+class AdaptadorDeque:
+    """Adapta um collections.deque cru (referência sem camada de classe)."""
+
+    def __init__(self, fila: Optional[deque] = None):
+        self.alvo = deque() if fila is None else fila
+
+    def inserir(self, chave: Any, valor: Any) -> None:
+        self.alvo.append(valor)
+
+    def remover(self, chave: Any) -> Optional[Any]:
+        return self.alvo.popleft() if self.alvo else None
+
+    def primeiro(self, chave: Any) -> Optional[Any]:
+        return self.alvo[0] if self.alvo else None
+
+    def ordenar(self) -> None:
+        elementos = sorted(self.alvo)
+        self.alvo.clear()
+        self.alvo.extend(elementos)
+
+    def limpar(self) -> None:
+        self.alvo.clear()
+
+    def __len__(self) -> int:
+        return len(self.alvo)
+
+
+class AdaptadorDicionario:
+    """
+    Adapta um dict (ou objeto com atributo `dados`, como DicionarioOrdenado).
+
+    Objetos com `dados` são tratados como o dict interno em todas as
+    operações: os métodos da classe (que imprimem a cada chamada) não são
+    usados, então o replay mede o custo do dicionário em si.
+    """
+
+    def __init__(self, dicionario: Any = None):
+        self.alvo = {} if dicionario is None else dicionario
+
+    @property
+    def _dados(self) -> Dict[Any, Any]:
+        return getattr(self.alvo, "dados", self.alvo)
+
+    def inserir(self, chave: Any, valor: Any) -> None:
+        if chave is None:
+            raise ValueError("'inserir' em dicionário exige chave (None indica operação de fila)")
+        self._dados[chave] = valor
+
+    def remover(self, chave: Any) -> Optional[Any]:
+        dados = self._dados
+        if chave is None:
+            # Sem chave: remove o item mais antigo (comportamento de fila)
+            if not dados:
+                return None
+            chave = next(iter(dados))
+        return dados.pop(chave, None)
+
+    def primeiro(self, chave: Any) -> Optional[Any]:
+        dados = self._dados
+        if chave is None:
+            return next(iter(dados.values()), None)
+        return dados.get(chave)
+
+    def ordenar(self) -> None:
+        dados = self._dados
+        itens = sorted(dados.items())
+        dados.clear()
+        dados.update(itens)
+
+    def limpar(self) -> None:
+        self._dados.clear()
+
+    def __len__(self) -> int:
+        return len(self._dados)
+
+
+# ---------------------------------------------------------------------------
+# Execução e relatório
+# ---------------------------------------------------------------------------
+
+class ResultadoReplay:
+    """Métricas de um replay: vazão e percentis de latência."""
+
+    def __init__(self, nome: str, total: int, tempo_total: float,
+                 latencias_ns: List[int], contagem: Dict[str, int],
+                 tamanho_final: int):
+        self.nome = nome
+        self.total = total
+        self.tempo_total = tempo_total
+        self.contagem = contagem
+        self.tamanho_final = tamanho_final
+        self._latencias_ns = sorted(latencias_ns)
+
+    @property
+    def ops_por_segundo(self) -> float:
+        return self.total / self.tempo_total if self.tempo_total > 0 else 0.0
+
+    def percentil(self, p: float) -> float:
+        """Latência (em microssegundos) no percentil `p` (0-100)."""
+        if not self._latencias_ns:
+            return 0.0
+        indice = min(len(self._latencias_ns) - 1,
+                     int(len(self._latencias_ns) * p / 100))
+        return self._latencias_ns[indice] / 1000
+
+    def __str__(self) -> str:
+        linhas = [
+            f"{self.nome}:",
+            f"   Operações:   {self.total:,} em {self.tempo_total:.4f}s",
+            f"   Vazão:       {self.ops_por_segundo:,.0f} ops/s",
+        ]
+        if self._latencias_ns:
+            linhas.append(
+                f"   Latência:    p50={self.percentil(50):.2f}µs "
+                f"p95={self.percentil(95):.2f}µs "
+                f"p99={self.percentil(99):.2f}µs "
+                f"máx={self._latencias_ns[-1] / 1000:.2f}µs"
+            )
+        contagem = ", ".join(f"{k}={v:,}" for k, v in self.contagem.items() if v)
+        linhas.append(f"   Por tipo:    {contagem}")
+        linhas.append(f"   Tamanho final: {self.tamanho_final:,}")
+        return "\n".join(linhas)
+
+
+def executar_trace(adaptador: Any, operacoes: Iterable[Operacao],
+                   nome: str = "replay",
+                   medir_latencia: bool = True) -> ResultadoReplay:
+    """
+    Executa as operações contra o adaptador o mais rápido possível.
+
+    Com `medir_latencia=False` apenas o tempo total é medido, eliminando
+    o custo de `perf_counter_ns` por operação.
+    """
+    despacho = {
+        "inserir": lambda op: adaptador.inserir(op.chave, op.valor),
+        "remover": lambda op: adaptador.remover(op.chave),
+        "primeiro": lambda op: adaptador.primeiro(op.chave),
+        "ordenar": lambda op: adaptador.ordenar(),
+        "limpar": lambda op: adaptador.limpar(),
+    }
+    contagem = dict.fromkeys(OPERACOES, 0)
+    latencias = []
+    relogio = time.perf_counter_ns
+
+    inicio = time.perf_counter()
+    if medir_latencia:
+        for op in operacoes:
+            executar = despacho[op.tipo]
+            t0 = relogio()
+            executar(op)
+            latencias.append(relogio() - t0)
+            contagem[op.tipo] += 1
+    else:
+        for op in operacoes:
+            despacho[op.tipo](op)
+            contagem[op.tipo] += 1
+    tempo_total = time.perf_counter() - inicio
+
+    return ResultadoReplay(nome, sum(contagem.values()), tempo_total,
+                           latencias, contagem, len(adaptador))
+
+
+def comparar_implementacoes(operacoes: Iterable[Operacao],
+                            adaptadores: Dict[str, Any],
+                            medir_latencia: bool = True) -> List[ResultadoReplay]:
+    """Executa o mesmo trace (materializado uma vez) em cada implementação."""
+    trace = list(operacoes)
+    return [executar_trace(adaptador, trace, nome, medir_latencia)
+            for nome, adaptador in adaptadores.items()]
+
+
+def main():
+    """Executa o replay de um arquivo ou de uma carga sintética."""
+    print("=" * 60)
+    print("REPLAY DE OPERAÇÕES - TESTE DE CARGA")
+    print("=" * 60)
+
+    if len(sys.argv) > 1:
+        caminho = sys.argv[1]
+        print(f"\nTrace: {caminho}")
+        trace = list(ler_trace_arquivo(caminho))
+        com_chaves = any(op.chave is not None for op in trace)
+    else:
+        print("\nCarga sintética: Poisson + rajadas + chaves Zipf")
+        trace = None
+        com_chaves = None
+
+    if com_chaves is not True:
+        print("\n--- FILAS ---")
+        operacoes = trace if trace is not None else gerar_carga(
+            n_operacoes=200000, semente=42)
+        for resultado in comparar_implementacoes(operacoes, {
+            "FilaOtimizada": AdaptadorFila(),
+            "deque": AdaptadorDeque(),
+            "FilaSemDuplicatas": AdaptadorFila(FilaSemDuplicatas()),
+        }):
+            print(resultado)
+
+    if com_chaves is not False:
+        print("\n--- DICIONÁRIOS ---")
+        operacoes = trace if trace is not None else gerar_carga(
+            n_operacoes=200000, com_chaves=True, semente=42)
+        for resultado in comparar_implementacoes(operacoes, {
+            "dict": AdaptadorDicionario(),
+        }):
+            print(resultado)
+
+
+if __name__ == "__main__":
+    main()
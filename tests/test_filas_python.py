@@ -0,0 +1,82 @@
+"""Testes das filas do tutorial."""
+
+import pytest
+
+from filas_python import FilaOtimizada, FilaSemDuplicatas
+
+
+def test_fila_otimizada_estender_e_iterar():
+    fila = FilaOtimizada()
+    fila.inserir(1)
+    fila.estender([2, 3])
+    assert list(fila) == [1, 2, 3]
+    assert fila.remover() == 1
+
+
+def test_sem_duplicatas_fifo():
+    fila = FilaSemDuplicatas()
+    for job in ["a", "b", "c"]:
+        assert fila.inserir(job) is True
+    assert (fila.primeiro(), fila.ultimo()) == ("a", "c")
+    assert [fila.remover(), fila.remover(), fila.remover()] == ["a", "b", "c"]
+    assert fila.remover() is None
+    assert fila.vazia()
+
+
+def test_sem_duplicatas_fila_vazia():
+    fila = FilaSemDuplicatas()
+    assert fila.primeiro() is None
+    assert fila.ultimo() is None
+    assert fila.tamanho() == 0
+    assert fila.remover_item("x") is False
+
+
+def test_politica_ignorar():
+    fila = FilaSemDuplicatas()
+    fila.inserir("a")
+    fila.inserir("b")
+    assert fila.inserir("a") is False
+    assert fila.listar() == ["a", "b"]
+    assert len(fila) == 2
+
+
+def test_politica_mover_fim():
+    fila = FilaSemDuplicatas(politica="mover_fim")
+    for job in ["a", "b", "c"]:
+        fila.inserir(job)
+    assert fila.inserir("a") is False
+    assert fila.listar() == ["b", "c", "a"]
+    assert fila.ultimo() == "a"
+
+
+def test_politica_invalida():
+    with pytest.raises(ValueError):
+        FilaSemDuplicatas(politica="duplicar")
+
+
+def test_contem_e_remover_item():
+    fila = FilaSemDuplicatas()
+    for job in ["a", "b", "c"]:
+        fila.inserir(job)
+    assert fila.contem("b")
+    assert "b" in fila
+    assert fila.remover_item("b") is True
+    assert not fila.contem("b")
+    assert fila.remover_item("b") is False
+    assert fila.listar() == ["a", "c"]
+    # Depois de removido, o item pode ser inserido de novo (no final)
+    assert fila.inserir("b") is True
+    assert fila.listar() == ["a", "c", "b"]
+
+
+def test_ordenar_e_limpar():
+    fila = FilaSemDuplicatas()
+    for n in [3, 1, 2]:
+        fila.inserir(n)
+    fila.ordenar()
+    assert fila.listar() == [1, 2, 3]
+    assert fila.remover() == 1
+    assert fila.inserir(3) is False
+    fila.limpar()
+    assert fila.vazia()
+    assert str(fila) == "FilaSemDuplicatas([])"
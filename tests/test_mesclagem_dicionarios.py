@@ -0,0 +1,56 @@
+"""Testes da mesclagem de dicionários."""
+
+from collections import OrderedDict
+from types import MappingProxyType
+
+import pytest
+
+from mesclagem_dicionarios import (
+    mesclar_dicionarios,
+    mesclar_ordenados,
+    primeiro_vence,
+    somar,
+    update_lote,
+)
+
+
+def test_resolvedores():
+    a = {"a": 1, "c": 3}
+    b = {"a": 10, "b": 2}
+    assert mesclar_dicionarios(a, b) == {"a": 10, "b": 2, "c": 3}
+    assert mesclar_dicionarios(a, b, resolver=somar) == {"a": 11, "b": 2, "c": 3}
+    assert mesclar_dicionarios(a, b, resolver=primeiro_vence) == {"a": 1, "b": 2, "c": 3}
+    assert list(mesclar_dicionarios(a, b)) == ["a", "b", "c"]
+
+
+def test_fonte_fora_de_ordem_levanta_erro():
+    with pytest.raises(ValueError):
+        mesclar_dicionarios({3: 1, 1: 1}, {1: 1, 3: 1}, resolver=somar)
+
+
+def test_fontes_nao_ordenadas():
+    resultado = mesclar_dicionarios({3: 1, 1: 1}, {1: 1, 3: 1}, resolver=somar,
+                                    ordenados=False)
+    assert resultado == {1: 2, 3: 2}
+
+
+def test_mesclar_sem_fontes():
+    assert list(mesclar_ordenados()) == []
+
+
+def test_update_lote():
+    destino = {"a": 1}
+    assert update_lote(destino, {"a": 1, "c": 3}, [("a", 10), ("b", 2)],
+                       resolver=somar) is destino
+    assert destino == {"a": 12, "c": 3, "b": 2}
+    assert update_lote({}, {"a": 1}, [("a", 2)]) == {"a": 2}
+
+
+@pytest.mark.parametrize("tipo", [MappingProxyType, OrderedDict])
+def test_outros_mapeamentos(tipo):
+    fonte = tipo({"ab": 1, "cd": 2})
+    assert mesclar_dicionarios(fonte) == {"ab": 1, "cd": 2}
+    assert mesclar_dicionarios(fonte, {"ab": 10}, resolver=somar,
+                               ordenados=False) == {"ab": 11, "cd": 2}
+    assert update_lote({"ab": 1}, fonte, resolver=somar) == {"ab": 2, "cd": 2}
+    assert update_lote({}, fonte) == {"ab": 1, "cd": 2}
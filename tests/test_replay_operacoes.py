@@ -0,0 +1,113 @@
+"""Testes do driver de replay de operações."""
+
+import pytest
+
+from replay_operacoes import (
+    AdaptadorDicionario,
+    AdaptadorFila,
+    Operacao,
+    escrever_trace,
+    executar_trace,
+    gerar_carga,
+    ler_trace,
+    ler_trace_arquivo,
+)
+
+
+def test_trace_ida_e_volta(tmp_path):
+    operacoes = [
+        Operacao("inserir", None, "Cliente 1"),
+        Operacao("inserir", None, 42),
+        Operacao("inserir", "007", 3.5),
+        Operacao("inserir", "chave com espaço", 'aspas "dentro"'),
+        Operacao("inserir", None, None),
+        Operacao("inserir", None, [1, "a b", [2]]),
+        Operacao("inserir", "produto", {"preco": 2, "nome": "caneta azul"}),
+        Operacao("inserir", None, '[nao, "json"'),
+        Operacao("remover"),
+        Operacao("remover", "007"),
+        Operacao("primeiro", "k1"),
+        Operacao("primeiro"),
+        Operacao("ordenar"),
+        Operacao("limpar"),
+    ]
+    caminho = tmp_path / "trace.txt"
+    assert escrever_trace(operacoes, str(caminho)) == len(operacoes)
+    assert list(ler_trace_arquivo(str(caminho))) == operacoes
+
+
+def test_trace_tupla_volta_como_lista(tmp_path):
+    caminho = tmp_path / "trace.txt"
+    escrever_trace([Operacao("inserir", None, (1, 2)),
+                    Operacao("inserir", (3, "x y"), 4)], str(caminho))
+    assert list(ler_trace_arquivo(str(caminho))) == [
+        Operacao("inserir", None, [1, 2]),
+        Operacao("inserir", [3, "x y"], 4),
+    ]
+
+
+def test_trace_sintetico_ida_e_volta(tmp_path):
+    operacoes = list(gerar_carga(n_operacoes=2000, com_chaves=True, semente=1))
+    caminho = tmp_path / "trace.txt"
+    escrever_trace(operacoes, str(caminho))
+    assert list(ler_trace_arquivo(str(caminho))) == operacoes
+
+
+def test_trace_escrito_a_mao():
+    linhas = ["# comentário", "", "inserir Cliente-1", "inserir banana 3.5",
+              "remover", "ordenar"]
+    assert list(ler_trace(linhas)) == [
+        Operacao("inserir", valor="Cliente-1"),
+        Operacao("inserir", "banana", 3.5),
+        Operacao("remover"),
+        Operacao("ordenar"),
+    ]
+
+
+@pytest.mark.parametrize("linha", [
+    "empilhar 1",
+    "inserir 1 2 3",
+    "remover 1 2 3",
+    "primeiro a b",
+    "ordenar 1",
+    "limpar x",
+])
+def test_trace_linha_invalida(linha):
+    with pytest.raises(ValueError):
+        list(ler_trace([linha]))
+
+
+def test_inserir_sem_chave_em_dicionario():
+    with pytest.raises(ValueError):
+        executar_trace(AdaptadorDicionario(), [Operacao("inserir", None, 1)])
+
+
+def test_executar_trace_fila():
+    resultado = executar_trace(AdaptadorFila(), gerar_carga(n_operacoes=1000, semente=3))
+    assert resultado.total == 1000
+    assert sum(resultado.contagem.values()) == 1000
+
+
+def test_executar_trace_dicionario():
+    adaptador = AdaptadorDicionario()
+    trace = [Operacao("inserir", "b", 2), Operacao("inserir", "a", 1),
+             Operacao("ordenar"), Operacao("remover", "b")]
+    resultado = executar_trace(adaptador, trace)
+    assert resultado.total == 4
+    assert adaptador.alvo == {"a": 1}
+
+
+def test_adaptador_dicionario_usa_dados_sem_imprimir(capsys):
+    class ComDados:
+        def __init__(self):
+            self.dados = {}
+
+        def ordenar_por_chave(self):
+            print("não deveria ser chamado")
+
+    alvo = ComDados()
+    trace = [Operacao("inserir", "b", 2), Operacao("inserir", "a", 1),
+             Operacao("ordenar"), Operacao("primeiro")]
+    executar_trace(AdaptadorDicionario(alvo), trace)
+    assert list(alvo.dados.items()) == [("a", 1), ("b", 2)]
+    assert capsys.readouterr().out == ""
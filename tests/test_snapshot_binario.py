@@ -0,0 +1,196 @@
+"""Testes do formato de snapshot binário."""
+
+from collections import deque
+import os
+import stat
+import sys
+
+import pytest
+
+from filas_python import FilaOtimizada, FilaSemDuplicatas
+from snapshot_binario import (
+    TIPO_DICIONARIO,
+    TIPO_FILA,
+    carregar_dicionario,
+    carregar_fila,
+    iterar_snapshot,
+    ler_cabecalho,
+    salvar_dicionario,
+    salvar_fila,
+)
+
+
+CASOS_FILA = {
+    "vazia": [],
+    "int8": [1, -128, 127],
+    "int16": [300, -40000 // 2],
+    "int32": [70000, -(2 ** 31)],
+    "int64": [2 ** 40, -(2 ** 63), 2 ** 63 - 1],
+    "acima_int64": [1, 2 ** 70, -(2 ** 64)],
+    "bool": [True, False, True],
+    "float": [1.5, -0.0, float("inf")],
+    "strings": ["a", "Cliente 1", "", "çãõ", "日本"],
+    "string_vazia": [""],
+    "surrogate": ["\udc80", "ok\ud800"],
+    "com_nul": ["a\x00b", "c", ""],
+    "misto": [1, "dois", 3.0, None, (4, 5), {"x": 1}],
+    "grande": list(range(10000)),
+}
+
+
+def _fila(elementos):
+    fila = FilaOtimizada()
+    fila.estender(elementos)
+    return fila
+
+
+def _assert_igual_com_tipos(obtido, esperado):
+    assert obtido == esperado
+    assert [type(x) for x in obtido] == [type(x) for x in esperado]
+
+
+@pytest.mark.parametrize("comprimir", [False, True], ids=["bruto", "zlib"])
+@pytest.mark.parametrize("nome", sorted(CASOS_FILA))
+def test_fila_ida_e_volta(tmp_path, nome, comprimir):
+    elementos = CASOS_FILA[nome]
+    caminho = str(tmp_path / "fila.snap")
+    tamanho = salvar_fila(_fila(elementos), caminho, comprimir=comprimir,
+                          tamanho_bloco=3)
+    assert tamanho == os.path.getsize(caminho)
+
+    carregada = carregar_fila(caminho)
+    assert isinstance(carregada, FilaOtimizada)
+    _assert_igual_com_tipos(carregada.listar(), elementos)
+    _assert_igual_com_tipos(list(iterar_snapshot(caminho)), elementos)
+
+    info = ler_cabecalho(caminho)
+    assert (info.tipo, info.comprimido, info.total) == (TIPO_FILA, comprimir, len(elementos))
+
+
+@pytest.mark.parametrize("comprimir", [False, True], ids=["bruto", "zlib"])
+def test_dicionario_ida_e_volta(tmp_path, comprimir):
+    dados = {"a": 1, "b": 2.5, 3: "x", "produto": {"preco": 2}, "z": "\udc80"}
+    caminho = str(tmp_path / "dict.snap")
+    salvar_dicionario(dados, caminho, comprimir=comprimir, tamanho_bloco=2)
+
+    carregado = carregar_dicionario(caminho)
+    assert carregado == dados
+    assert list(carregado) == list(dados)
+    assert list(iterar_snapshot(caminho)) == list(dados.items())
+    assert ler_cabecalho(caminho).tipo == TIPO_DICIONARIO
+
+
+def test_dicionario_com_atributo_dados(tmp_path):
+    class ComDados:
+        def __init__(self, dados=None):
+            self.dados = dados or {}
+
+    caminho = str(tmp_path / "dict.snap")
+    salvar_dicionario(ComDados({"banana": 3.5, "uva": 8.0}), caminho)
+    destino = carregar_dicionario(caminho, ComDados())
+    assert destino.dados == {"banana": 3.5, "uva": 8.0}
+
+
+def test_dicionario_vazio(tmp_path):
+    caminho = str(tmp_path / "dict.snap")
+    salvar_dicionario({}, caminho)
+    assert carregar_dicionario(caminho) == {}
+
+
+@pytest.mark.parametrize("comprimir", [False, True], ids=["bruto", "zlib"])
+def test_carregar_em_outras_filas(tmp_path, comprimir):
+    caminho = str(tmp_path / "fila.snap")
+    salvar_fila(deque(["a", "b", "a", "c"]), caminho, comprimir=comprimir)
+
+    sem_duplicatas = carregar_fila(caminho, FilaSemDuplicatas())
+    assert sem_duplicatas.listar() == ["a", "b", "c"]
+
+    assert list(carregar_fila(caminho, deque())) == ["a", "b", "a", "c"]
+
+
+def test_salvar_fila_sem_duplicatas(tmp_path):
+    fila = FilaSemDuplicatas()
+    for job in ["job-1", "job-2", "job-3"]:
+        fila.inserir(job)
+    caminho = str(tmp_path / "fila.snap")
+    salvar_fila(fila, caminho)
+    assert carregar_fila(caminho).listar() == ["job-1", "job-2", "job-3"]
+
+
+def test_tipo_errado(tmp_path):
+    caminho = str(tmp_path / "dict.snap")
+    salvar_dicionario({"a": 1}, caminho)
+    with pytest.raises(ValueError):
+        carregar_fila(caminho)
+
+    salvar_fila(_fila([1]), caminho)
+    with pytest.raises(ValueError):
+        carregar_dicionario(caminho)
+
+
+def test_magic_invalido(tmp_path):
+    caminho = tmp_path / "lixo.snap"
+    caminho.write_bytes(b"NAOE" + bytes(20))
+    with pytest.raises(ValueError):
+        carregar_fila(str(caminho))
+
+    caminho.write_bytes(b"FD")
+    with pytest.raises(ValueError):
+        ler_cabecalho(str(caminho))
+
+
+@pytest.mark.parametrize("comprimir", [False, True], ids=["bruto", "zlib"])
+def test_arquivo_truncado(tmp_path, comprimir):
+    caminho = tmp_path / "fila.snap"
+    salvar_fila(_fila([f"Cliente {i}" for i in range(1000)]), str(caminho),
+                comprimir=comprimir, tamanho_bloco=100)
+    conteudo = caminho.read_bytes()
+    caminho.write_bytes(conteudo[:len(conteudo) // 2])
+    with pytest.raises(ValueError):
+        carregar_fila(str(caminho))
+
+
+def test_corpo_comprimido_corrompido(tmp_path):
+    caminho = tmp_path / "fila.snap"
+    salvar_fila(_fila([f"Cliente {i}" for i in range(1000)]), str(caminho),
+                comprimir=True)
+    conteudo = bytearray(caminho.read_bytes())
+    inicio = len(conteudo) // 2
+    conteudo[inicio:inicio + 16] = bytes(b ^ 0xFF for b in conteudo[inicio:inicio + 16])
+    caminho.write_bytes(bytes(conteudo))
+    with pytest.raises(ValueError):
+        carregar_fila(str(caminho))
+
+
+def test_falha_na_escrita_preserva_snapshot_anterior(tmp_path):
+    class FilaQuebrada:
+        def __len__(self):
+            return 2
+
+        def __iter__(self):
+            yield 1
+            raise RuntimeError("falha no meio do checkpoint")
+
+    caminho = str(tmp_path / "fila.snap")
+    salvar_fila(_fila([1, 2, 3]), caminho)
+    with pytest.raises(RuntimeError):
+        salvar_fila(FilaQuebrada(), caminho, tamanho_bloco=1)
+
+    assert carregar_fila(caminho).listar() == [1, 2, 3]
+    assert os.listdir(tmp_path) == ["fila.snap"]
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="permissões POSIX")
+def test_permissoes_do_snapshot(tmp_path):
+    caminho = str(tmp_path / "fila.snap")
+    umask = os.umask(0o022)
+    try:
+        salvar_fila(_fila([1]), caminho)
+        assert stat.S_IMODE(os.stat(caminho).st_mode) == 0o644
+
+        # Um snapshot existente mantém as permissões ao ser sobrescrito
+        os.chmod(caminho, 0o640)
+        salvar_fila(_fila([2]), caminho)
+        assert stat.S_IMODE(os.stat(caminho).st_mode) == 0o640
+    finally:
+        os.umask(umask)